@@ -2,14 +2,21 @@
 # reddit_sentiment_analyzer_updated.py
 
 import os
+import csv
 import json
 import time
+import functools
+import asyncio
 import logging
 import argparse
+import threading
 import requests
 import re
-import pandas as pd
-from datetime import datetime
+import sqlite3
+import subprocess
+import aiohttp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from dotenv import load_dotenv
 from selenium import webdriver
@@ -20,18 +27,24 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
 
 # Sentiment analysis libraries
 import nltk
 from nltk.sentiment.vader import SentimentIntensityAnalyzer
 import numpy as np
 
-# Download NLTK resources if needed
+# Fast JSON serializer, falling back to the standard library
 try:
-    nltk.data.find('vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon')
-    nltk.download('punkt')
+    import orjson
+except ImportError:
+    orjson = None
+
+# Reddit API client, only needed when API credentials are configured
+try:
+    import praw
+except ImportError:
+    praw = None
 
 # Load environment variables
 load_dotenv()
@@ -66,6 +79,311 @@ PROGRAMMING_LANGUAGES = {
     }
 }
 
+# Reddit JSON endpoints used when scraping without a browser
+REDDIT_BASE_URL = "https://www.reddit.com"
+MAX_CONCURRENT_REQUESTS = 20
+
+# Resources the browser never needs to download for text extraction. The blocklist
+# also applies to page navigations, so ad and tracker patterns are anchored to their
+# hosts rather than matching words that could appear in a post's URL slug.
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.gif', '*.svg', '*.woff*', '*.mp4', '*.css',
+    '*://*.doubleclick.net/*', '*://*.googlesyndication.com/*',
+    '*://*.google-analytics.com/*', '*://*.googletagmanager.com/*'
+]
+
+# Matches Reddit post URLs and captures the post ID
+POST_URL_RE = re.compile(r'reddit\.com/r/[^/]+/comments/([a-z0-9]+)(?:/|$)')
+
+# Captures the subreddit name from a URL path
+SUBREDDIT_RE = re.compile(r'/r/([^/]+)')
+
+# Captures the page number from a paginated listing URL
+PAGE_RE = re.compile(r'page=(\d+)')
+
+# CSS selectors for each part of a subreddit or post page, tried in order
+POST_SELECTORS = (
+    "div[data-testid='post-container']",
+    "div.thing",
+    "div.Post",
+    "shreddit-post",
+    "[data-click-id='body']"
+)
+POST_LINK_SELECTORS = (
+    "div.thing a.title",
+    "a[data-click-id='body']",
+    "a.title",
+    "a[data-testid='post-title']",
+    "shreddit-post a[slot='full-post-link']"
+)
+POST_BODY_SELECTORS = (
+    "div[data-testid='post-content']",
+    "div[slot='text-body']",
+    "[data-click-id='text']",
+    "div.md",
+    ".sitetable .usertext-body",
+    "div[data-test-id='post-content']"
+)
+# Old Reddit renders the sidebar (with its own h1, div.md and <time>) ahead of the
+# post, so its post fields are scoped to #siteTable and tried first
+TITLE_SELECTORS = ("#siteTable a.title", "h1", "h1[slot='title']", ".title a", "[data-testid='post-title']")
+AUTHOR_SELECTORS = ("#siteTable .tagline .author", "a[data-testid='post_author']", "a[slot='author']", ".author", "a.author")
+SUBREDDIT_SELECTORS = ("a[data-testid='subreddit-link']", "a[slot='subreddit-name']", ".subreddit", "a.subreddit")
+DATE_SELECTORS = ("#siteTable .tagline time", "span[data-testid='post_timestamp']", "span[slot='posted-time']", "time")
+CONTENT_SELECTORS = (
+    "#siteTable .usertext-body .md",
+    "div[data-test-id='post-content']",
+    "div[slot='text-body']",
+    "[data-click-id='text']"
+)
+VOTE_SELECTORS = ("div[id^='vote-arrows-']", "faceplate-number[slot='upvote-count']", ".score.unvoted", ".score")
+COMMENT_SELECTORS = ("span[data-click-id='comments']", "span[slot='comment-count']", ".comments", "a.comments")
+NEXT_BUTTON_SELECTORS = (
+    "button[aria-label='Next']",
+    "a.next-button",
+    "span.next-button a",
+    "a[rel='next']",
+    ".nav-buttons .next-button a",
+    "a.next"
+)
+LOAD_MORE_SELECTORS = (
+    "button:contains('Load more')",
+    "button.MoreCommentsLink",
+    "a:contains('load more')",
+    "button[data-click-id='load-more']",
+    "button.button:contains('More')"
+)
+
+# Seconds to wait for any of a set of selectors to appear
+SELECTOR_WAIT_TIMEOUT = 15
+
+# Seconds to wait for the page to change after clicking "next"/"load more", or scrolling
+PAGE_CHANGE_TIMEOUT = 5
+SCROLL_LOAD_TIMEOUT = 3
+
+# Returns the attributes of a next-page candidate (arguments[0]) in one round trip
+BUTTON_ATTRS_JS = """
+    const el = arguments[0];
+    return {
+        disabled: el.disabled === true || el.hasAttribute('disabled'),
+        tag: el.tagName.toLowerCase(),
+        href: el.href || null
+    };
+"""
+
+# Matches every post on a listing page, for counting newly loaded posts
+POST_CONTAINER_SELECTOR = "div[data-testid='post-container'], shreddit-post, div.thing"
+
+# Async script resolving with the first of arguments[0] (selectors) that
+# appears in the DOM, or null after arguments[1] milliseconds
+WAIT_FOR_ANY_SELECTOR_JS = """
+    const selectors = arguments[0];
+    const done = arguments[arguments.length - 1];
+    let finished = false;
+    
+    function check() {
+        for (const selector of selectors) {
+            if (document.querySelector(selector)) {
+                finished = true;
+                done(selector);
+                return true;
+            }
+        }
+        return false;
+    }
+    
+    if (!check()) {
+        const observer = new MutationObserver(() => {
+            if (!finished && check()) {
+                observer.disconnect();
+            }
+        });
+        observer.observe(document.documentElement, {childList: true, subtree: true});
+        setTimeout(() => {
+            observer.disconnect();
+            if (!finished) {
+                finished = true;
+                done(null);
+            }
+        }, arguments[1]);
+    }
+"""
+
+# Class/ID fragments marking page chrome rather than post content
+# ("nav" also covers "navigation"), as one alternation for a single regex test
+UI_INDICATORS = (
+    "header", "footer", "sidebar", "nav", "menu",
+    "comment", "toolbar", "banner", "ad", "widget", "modal",
+    "popup", "overlay", "tooltip", "community-widget"
+)
+UI_INDICATOR_PATTERN = "|".join(UI_INDICATORS)
+
+# Returns the text of every <p> of 20+ characters that isn't inside a UI area,
+# checking the element and up to 4 ancestors against arguments[0] (UI_INDICATOR_PATTERN)
+EXTRACT_PARAGRAPHS_JS = """
+    const uiPattern = new RegExp(arguments[0]);
+    
+    function inUiArea(element) {
+        let node = element;
+        for (let level = 0; level < 5 && node; level++) {
+            const attrs = ((node.getAttribute('class') || '') + ' ' + (node.id || '')).toLowerCase();
+            if (uiPattern.test(attrs)) {
+                return true;
+            }
+            node = node.parentElement;
+        }
+        return false;
+    }
+    
+    const paragraphs = [];
+    document.querySelectorAll('p').forEach(p => {
+        const text = p.innerText.trim();
+        if (text.length >= 20 && !inUiArea(p)) {
+            paragraphs.push(text);
+        }
+    });
+    return paragraphs;
+"""
+
+# Defines firstText(selectors, shadowSelector), which returns the text of the
+# first selector that matches, then tries the shreddit-post shadow DOM
+FIRST_TEXT_JS = """
+    const postElement = document.querySelector('shreddit-post');
+    const shadowRoot = postElement && postElement.shadowRoot;
+    
+    function firstText(selectors, shadowSelector) {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (element && element.textContent.trim()) {
+                return element.textContent.trim();
+            }
+        }
+        if (shadowRoot && shadowSelector) {
+            const element = shadowRoot.querySelector(shadowSelector);
+            if (element && element.textContent.trim()) {
+                return element.textContent.trim();
+            }
+        }
+        return null;
+    }
+"""
+
+# Single-field scripts used when the batched extraction misses a field
+TITLE_JS = FIRST_TEXT_JS + f"return firstText({json.dumps(TITLE_SELECTORS)}, 'h1, [slot=\"title\"]');"
+AUTHOR_JS = FIRST_TEXT_JS + f"return firstText({json.dumps(AUTHOR_SELECTORS)}, 'a[slot=\"author\"]');"
+DATE_JS = FIRST_TEXT_JS + f"return firstText({json.dumps(DATE_SELECTORS)}, 'span[slot=\"posted-time\"]');"
+CONTENT_JS = FIRST_TEXT_JS + f"return firstText({json.dumps(CONTENT_SELECTORS)}, 'div[slot=\"text-body\"], [data-click-id=\"text\"]');"
+VOTES_JS = FIRST_TEXT_JS + f"return firstText({json.dumps(VOTE_SELECTORS)}, \"faceplate-number[slot='upvote-count']\");"
+COMMENTS_JS = FIRST_TEXT_JS + f"return firstText({json.dumps(COMMENT_SELECTORS)}, \"span[slot='comment-count']\");"
+
+# Extracts every post field in a single WebDriver round-trip, keyed like post_data
+EXTRACT_POST_FIELDS_JS = FIRST_TEXT_JS + f"""
+    return {{
+        title: firstText({json.dumps(TITLE_SELECTORS)}, 'h1, [slot="title"]'),
+        author: firstText({json.dumps(AUTHOR_SELECTORS)}, 'a[slot="author"]'),
+        subreddit: firstText({json.dumps(SUBREDDIT_SELECTORS)}, null),
+        post_date: firstText({json.dumps(DATE_SELECTORS)}, 'span[slot="posted-time"]'),
+        content: firstText({json.dumps(CONTENT_SELECTORS)}, 'div[slot="text-body"], [data-click-id="text"]'),
+        votes: firstText({json.dumps(VOTE_SELECTORS)}, "faceplate-number[slot='upvote-count']"),
+        comments_count: firstText({json.dumps(COMMENT_SELECTORS)}, "span[slot='comment-count']")
+    }};
+"""
+
+# Runs of 6+ symbols/emoji trigger VADER's quadratic worst case; collapse them to 5
+SYMBOL_RUN_RE = re.compile(r'([^\w\s]){6,}')
+
+# Below this many texts, scoring in-process beats spawning worker processes
+SENTIMENT_POOL_THRESHOLD = 200
+
+NEUTRAL_SENTIMENT = {'compound': 0, 'pos': 0, 'neu': 0, 'neg': 0}
+
+# Per-post sentiment scores packed for vectorized aggregation
+SENTIMENT_DTYPE = [('compound', 'f8'), ('positive', 'f8'), ('neutral', 'f8'), ('negative', 'f8')]
+
+# Compound score buckets, lowest first: below -0.5, [-0.5, -0.05), [-0.05, 0.05],
+# (0.05, 0.5] and above 0.5. The lower edges are closed on the left, the upper on the right.
+SENTIMENT_BUCKETS = ('very_negative', 'negative', 'neutral', 'positive', 'very_positive')
+LOWER_BUCKET_EDGES = np.array([-0.5, -0.05])
+UPPER_BUCKET_EDGES = np.array([0.05, 0.5])
+
+def _json_line(data):
+    """Serialize data as one compact UTF-8 JSON line, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _ensure_vader_lexicon():
+    """Download the VADER lexicon if it isn't installed yet."""
+    try:
+        nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        nltk.download('vader_lexicon')
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_post_id(url):
+    """Return the post ID of a Reddit post URL, or None if it isn't one."""
+    match = POST_URL_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _sentiment_distribution(compound):
+    """Count compound scores per SENTIMENT_BUCKETS entry."""
+    buckets = (np.searchsorted(LOWER_BUCKET_EDGES, compound, side='right')
+               + np.searchsorted(UPPER_BUCKET_EDGES, compound, side='left'))
+    return np.bincount(buckets, minlength=len(SENTIMENT_BUCKETS))
+
+
+# Per-process analyzer used by the sentiment worker pool
+_worker_analyzer = None
+
+
+def _init_sentiment_worker():
+    """Load the VADER lexicon once per worker process."""
+    global _worker_analyzer
+    _worker_analyzer = SentimentIntensityAnalyzer()
+
+
+def _score_text(text):
+    """Score one text in a worker process."""
+    if not text:
+        return dict(NEUTRAL_SENTIMENT)
+    return _worker_analyzer.polarity_scores(text)
+
+
+class TokenBucket:
+    """Thread-safe token bucket that only makes callers wait once it is empty."""
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self):
+        """Take a token and return how many seconds the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0
+    
+    def acquire(self):
+        """Block until a request may be made."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait, without blocking the event loop, until a request may be made."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
 class RedditSentimentAnalyzer:
     def __init__(self, config=None):
         """Initialize the Reddit sentiment analyzer with configuration."""
@@ -74,6 +392,9 @@ class RedditSentimentAnalyzer:
         # URLs and targets
         self.languages = self.config.get('LANGUAGES', ['r', 'go', 'rust'])
         
+        # Display name of each language, falling back to its key
+        self.language_names = {lang: PROGRAMMING_LANGUAGES.get(lang, {}).get('name', lang) for lang in self.languages}
+        
         # Browser settings
         self.user_agent = self.config.get('USER_AGENT', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/113.0.0.0 Safari/537.36')
         self.headless = self.config.get('HEADLESS', 'true').lower() == 'true'
@@ -84,27 +405,53 @@ class RedditSentimentAnalyzer:
         self.max_posts = int(self.config.get('MAX_POSTS', 20))
         
         # Rate limiting
-        self.request_delay = int(self.config.get('REQUEST_DELAY', 3000)) / 1000  # Convert to seconds
+        requests_per_minute = int(self.config.get('REQUESTS_PER_MINUTE', 60))
+        self.bucket = TokenBucket(rate=requests_per_minute / 60, capacity=requests_per_minute)
+        
+        # Use the Selenium browser instead of Reddit's JSON endpoints
+        self.scrape_html = self.config.get('SCRAPE_HTML', 'false').lower() == 'true'
+        self.max_workers = int(self.config.get('MAX_WORKERS', 8))  # Browsers running in parallel
+        
+        # Reddit API credentials; when set, posts are fetched through PRAW
+        self.client_id = self.config.get('REDDIT_CLIENT_ID', '')
+        self.client_secret = self.config.get('REDDIT_CLIENT_SECRET', '')
         
         # Output settings
         self.output_dir = Path(self.config.get('OUTPUT_DIR', 'output'))
         
         # Create directories
-        self.output_dir.mkdir(exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize webdriver
-        self.driver = None
+        # Post cache, shared across runs
+        self.cache_path = self.output_dir / 'cache.db'
+        self.cache_ttl = float(self.config.get('CACHE_TTL', 24)) * 3600  # Convert hours to seconds
+        self._cache_connections = []
         
-        # Collection for all posts
+        # WebDrivers are created lazily, one per worker thread
+        self._local = threading.local()
+        self._drivers = []
+        self._driver_path = None
+        
+        # Collection for all posts, shared between worker threads
+        self._lock = threading.Lock()
         self.all_posts = {}
-        self.visited_urls = set()
+        self._batch_fp = {}
+        self.visited_urls = set()  # Keys from _url_key, not the URLs themselves
         self.post_count = {lang: 0 for lang in self.languages}
         
-        # Initialize sentiment analyzer
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()
-        
+    @property
+    def driver(self):
+        """The WebDriver owned by the calling thread, created on first use."""
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            driver = self.setup_driver()
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+    
     def setup_driver(self):
-        """Set up the Selenium WebDriver with appropriate options."""
+        """Create a Selenium WebDriver with appropriate options."""
         logger.info("Setting up Chrome WebDriver...")
         
         chrome_options = Options()
@@ -131,16 +478,28 @@ class RedditSentimentAnalyzer:
         # Enable JavaScript
         chrome_options.add_argument("--enable-javascript")
         
-        # Set up Chrome driver
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Return from page loads on DOMContentLoaded instead of the full load event
+        chrome_options.page_load_strategy = 'eager'
+
+        # Skip image decoding and fetches entirely; only text is extracted
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+
+        # Set up Chrome driver, resolving the binary only once for all threads
+        with self._lock:
+            if self._driver_path is None:
+                self._driver_path = self._resolve_driver_path()
+        service = Service(self._driver_path)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
         
         # Set reasonable timeouts
-        self.driver.set_page_load_timeout(self.timeout)
-        self.driver.set_script_timeout(self.timeout)
+        driver.set_page_load_timeout(self.timeout)
+        driver.set_script_timeout(self.timeout)
         
         # Mask WebDriver to avoid detection
-        self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
             "source": """
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined
@@ -148,58 +507,142 @@ class RedditSentimentAnalyzer:
             """
         })
         
+        # Keep the HTTP cache on and skip media, fonts and trackers
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        
         logger.info("WebDriver setup complete")
+        return driver
+    
+    def _cache_connection(self):
+        """Return the calling thread's connection to the post cache, opening it on first use."""
+        conn = getattr(self._local, 'cache', None)
+        if conn is None:
+            # Only this thread queries the connection; start_analysis closes it from the main thread
+            conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS posts (post_id TEXT PRIMARY KEY, fetched_at REAL, json_blob TEXT)")
+            self._local.cache = conn
+            with self._lock:
+                self._cache_connections.append(conn)
+        return conn
+    
+    def _get_cached_post(self, post_id):
+        """Return the cached post data if it is younger than the cache TTL, else None."""
+        try:
+            row = self._cache_connection().execute(
+                "SELECT json_blob FROM posts WHERE post_id = ? AND fetched_at > ?",
+                (post_id, time.time() - self.cache_ttl)
+            ).fetchone()
+            return json.loads(row[0]) if row else None
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading post cache: {e}")
+            return None
+    
+    def _cache_post(self, post_data):
+        """Store freshly scraped post data in the cache."""
+        try:
+            conn = self._cache_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO posts (post_id, fetched_at, json_blob) VALUES (?, ?, ?)",
+                (post_data["post_id"], time.time(), json.dumps(post_data, ensure_ascii=False))
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing post cache: {e}")
+    
+    def _resolve_driver_path(self):
+        """Return the chromedriver path, only asking ChromeDriverManager again when Chrome changed."""
+        cache_path = self.output_dir / '.driver_cache.json'
+        chrome_version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        
+        try:
+            cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cache = {}
+        
+        driver_path = cache.get('driver_path')
+        if (chrome_version and cache.get('chrome_version') == chrome_version
+                and driver_path and self._driver_matches(driver_path, chrome_version)):
+            logger.info(f"Using cached ChromeDriver: {driver_path}")
+            return driver_path
+        
+        driver_path = ChromeDriverManager().install()
+        self._save_to_json({'chrome_version': chrome_version, 'driver_path': driver_path}, cache_path)
+        return driver_path
+    
+    def _driver_matches(self, driver_path, chrome_version):
+        """Check that the chromedriver binary runs and has the same major version as Chrome."""
+        try:
+            result = subprocess.run([driver_path, '--version'], capture_output=True, text=True, timeout=10)
+            # Output looks like: ChromeDriver 120.0.6099.109 (...)
+            driver_version = result.stdout.split()[1]
+        except (OSError, subprocess.SubprocessError, IndexError):
+            return False
+        
+        return driver_version.split('.')[0] == chrome_version.split('.')[0]
+    
+    @functools.cached_property
+    def sentiment_analyzer(self):
+        """VADER analyzer, loaded the first time a post is scored."""
+        _ensure_vader_lexicon()
+        return SentimentIntensityAnalyzer()
     
     def analyze_sentiment(self, text):
         """Analyze sentiment of text using VADER sentiment analyzer."""
         if not text:
-            return {'compound': 0, 'pos': 0, 'neu': 0, 'neg': 0}
+            return dict(NEUTRAL_SENTIMENT)
             
         return self.sentiment_analyzer.polarity_scores(text)
     
+    def _score_all(self):
+        """Score the content (or title) of every scraped post in a single pass."""
+        entries = []
+        for lang, posts in self.all_posts.items():
+            for idx, post in enumerate(posts):
+                text = post.get('content') or post.get('title') or ''
+                entries.append((lang, idx, SYMBOL_RUN_RE.sub(r'\1\1\1\1\1', text)))
+        
+        if not entries:
+            return
+        
+        texts = [text for _, _, text in entries]
+        logger.info(f"Scoring sentiment for {len(texts)} posts...")
+        
+        if len(texts) >= SENTIMENT_POOL_THRESHOLD:
+            _ensure_vader_lexicon()  # Before the workers start, so they don't all download it
+            with ProcessPoolExecutor(initializer=_init_sentiment_worker) as executor:
+                chunksize = max(1, len(texts) // (4 * (os.cpu_count() or 1)))
+                scores = list(executor.map(_score_text, texts, chunksize=chunksize))
+        else:
+            scores = [self.analyze_sentiment(text) for text in texts]
+        
+        for (lang, idx, _), score in zip(entries, scores):
+            self.all_posts[lang][idx]['sentiment'] = score
+    
     def start_analysis(self):
         """Start the scraping and sentiment analysis process for all configured languages."""
         try:
-            self.setup_driver()
-            
             # Initialize data structure for all posts
             for lang in self.languages:
                 if lang in PROGRAMMING_LANGUAGES:
                     self.all_posts[lang] = []
+                    self._batch_fp[lang] = open(self.output_dir / f"{lang}_posts.jsonl", "wb")
                 else:
                     logger.warning(f"Unknown language: {lang}, skipping...")
             
-            # Process each language
-            for lang in self.languages:
-                if lang not in PROGRAMMING_LANGUAGES:
-                    continue
-                    
-                lang_info = PROGRAMMING_LANGUAGES[lang]
-                logger.info(f"Starting analysis for {lang_info['name']} programming language")
-                
-                # Access each subreddit for this language
-                for subreddit in lang_info['subreddits']:
-                    subreddit_url = f"https://www.reddit.com/r/{subreddit}/hot/"
-                    logger.info(f"Processing subreddit: r/{subreddit}")
-                    
-                    try:
-                        self.scrape_subreddit(subreddit_url, lang)
-                        
-                        # Check if we've reached the maximum posts for this language
-                        if self.post_count[lang] >= self.max_posts:
-                            logger.info(f"Reached maximum post count ({self.max_posts}) for {lang_info['name']}. Moving to next language.")
-                            break
-                        
-                        # Respect rate limits between different subreddits
-                        time.sleep(self.request_delay)
-                    except Exception as e:
-                        logger.error(f"Error processing subreddit {subreddit}: {e}")
-                        continue
-                
-                # Save language results
-                lang_output_path = self.output_dir / f"{lang}_posts.json"
-                self._save_to_json(self.all_posts[lang], lang_output_path)
-                logger.info(f"Completed analysis for {lang_info['name']}. Total posts scraped: {len(self.all_posts[lang])}")
+            if self.scrape_html:
+                self._scrape_html()
+            elif self.client_id and self.client_secret:
+                if praw is None:
+                    logger.warning("Reddit API credentials are set but praw is not installed. Falling back to JSON endpoints.")
+                    asyncio.run(self._run())
+                else:
+                    self._scrape_api()
+            else:
+                asyncio.run(self._run())
             
             # Perform sentiment analysis and save results
             if any(len(posts) > 0 for posts in self.all_posts.values()):
@@ -220,10 +663,240 @@ class RedditSentimentAnalyzer:
                 logger.error(f"Failed to create emergency save: {save_error}")
                 
         finally:
-            # Always close the driver
-            if self.driver:
-                self.driver.quit()
-                logger.info("WebDriver closed")
+            # Always close the drivers
+            for driver in self._drivers:
+                driver.quit()
+            if self._drivers:
+                logger.info(f"Closed {len(self._drivers)} WebDriver(s)")
+            
+            for conn in self._cache_connections:
+                conn.close()
+            
+            for fp in self._batch_fp.values():
+                fp.close()
+    
+    async def _run(self):
+        """Scrape all configured subreddits concurrently through Reddit's JSON endpoints."""
+        headers = {'User-Agent': self.user_agent}
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            # Each (language, subreddit) pair keeps its own listing cursor
+            cursors = {
+                (lang, subreddit): None
+                for lang in self.all_posts
+                for subreddit in PROGRAMMING_LANGUAGES[lang]['subreddits']
+            }
+            candidates = {lang: [] for lang in self.all_posts}
+            
+            # Gather subreddit listings first, one page per round
+            for page_num in range(1, self.max_pages + 1):
+                pending = [key for key in cursors if len(candidates[key[0]]) < self.max_posts]
+                if not pending:
+                    break
+                
+                logger.info(f"Fetching listing page {page_num}/{self.max_pages} for {len(pending)} subreddits")
+                listings = await asyncio.gather(*[
+                    self._fetch(session, f"{REDDIT_BASE_URL}/r/{subreddit}/hot.json",
+                                {'limit': self.max_posts, 'after': cursors[(lang, subreddit)]})
+                    for lang, subreddit in pending
+                ])
+                
+                for (lang, subreddit), listing in zip(pending, listings):
+                    if not listing:
+                        del cursors[(lang, subreddit)]
+                        continue
+                    
+                    # Error bodies (e.g. {'error': 403}) and other shapes end this subreddit's listing
+                    try:
+                        permalinks = [child['data']['permalink'] for child in listing['data']['children']]
+                        after = listing['data'].get('after')
+                    except (KeyError, IndexError, TypeError, AttributeError) as e:
+                        logger.error(f"Unexpected listing response for r/{subreddit}: {e}")
+                        del cursors[(lang, subreddit)]
+                        continue
+                    
+                    for permalink in permalinks:
+                        post_url = REDDIT_BASE_URL + permalink
+                        if not self._mark_visited(post_url):
+                            continue
+                        candidates[lang].append(post_url)
+                    
+                    if after:
+                        cursors[(lang, subreddit)] = after
+                    else:
+                        del cursors[(lang, subreddit)]
+            
+            # Then gather all post-detail fetches
+            tasks = [
+                (lang, post_url)
+                for lang, post_urls in candidates.items()
+                for post_url in post_urls[:self.max_posts]
+            ]
+            logger.info(f"Fetching {len(tasks)} posts")
+            scraped_at = datetime.now(timezone.utc).isoformat()
+            results = await asyncio.gather(*[
+                self._fetch_post(session, post_url, lang, scraped_at) for lang, post_url in tasks
+            ])
+            
+            for (lang, _), post_data in zip(tasks, results):
+                if post_data:
+                    self._record_post(lang, post_data)
+    
+    async def _fetch(self, session, url, params=None):
+        """GET a Reddit JSON endpoint and return the parsed response, or None on failure."""
+        params = {key: value for key, value in (params or {}).items() if value is not None}
+        params['raw_json'] = 1  # Don't HTML-escape text fields
+        
+        await self.bucket.acquire_async()
+        async with self._semaphore:
+            try:
+                async with session.get(url, params=params) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+    
+    async def _fetch_post(self, session, post_url, language, scraped_at):
+        """Fetch a single post from its JSON endpoint and build the post data."""
+        cached = self._get_cached_post(self._extract_post_id(post_url))
+        if cached:
+            logger.info(f"Using cached post: {post_url}")
+            cached["language"] = language
+            return cached
+        
+        payload = await self._fetch(session, post_url.rstrip('/') + '.json')
+        if not payload:
+            return None
+        
+        try:
+            data = payload[0]['data']['children'][0]['data']
+            post_data = {
+                "post_id": data['id'],
+                "post_url": post_url,
+                "language": language,
+                "scraped_at": scraped_at,
+                "title": data['title'],
+                "author": data.get('author') or "Unknown",
+                "subreddit": data['subreddit_name_prefixed'],
+                "post_date": datetime.fromtimestamp(data['created_utc'], tz=timezone.utc).isoformat(),
+                "content": (data.get('selftext') or '').strip(),
+                "votes": str(data['ups']),
+                "comments_count": str(data['num_comments'])
+            }
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            logger.error(f"Unexpected response for {post_url}: {e}")
+            return None
+        
+        self._cache_post(post_data)
+        logger.info(f"Successfully extracted post data: {post_data['title']}")
+        return post_data
+    
+    def _scrape_api(self):
+        """Fetch posts for all configured subreddits through the Reddit API with PRAW."""
+        reddit = praw.Reddit(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            user_agent=self.user_agent
+        )
+        
+        for lang in self.all_posts:
+            lang_info = PROGRAMMING_LANGUAGES[lang]
+            logger.info(f"Starting analysis for {lang_info['name']} programming language")
+            
+            for subreddit in lang_info['subreddits']:
+                remaining = self.max_posts - self.post_count[lang]
+                if remaining <= 0:
+                    logger.info(f"Reached maximum post count ({self.max_posts}) for {lang_info['name']}. Moving to next language.")
+                    break
+                
+                logger.info(f"Processing subreddit: r/{subreddit}")
+                scraped_at = datetime.now(timezone.utc).isoformat()
+                try:
+                    for submission in reddit.subreddit(subreddit).hot(limit=remaining):
+                        post_url = REDDIT_BASE_URL + submission.permalink
+                        if not self._mark_visited(post_url):
+                            continue
+                        
+                        post_data = {
+                            "post_id": submission.id,
+                            "post_url": post_url,
+                            "language": lang,
+                            "scraped_at": scraped_at,
+                            "title": submission.title,
+                            "author": submission.author.name if submission.author else "Unknown",
+                            "subreddit": submission.subreddit_name_prefixed,
+                            "post_date": datetime.fromtimestamp(submission.created_utc, tz=timezone.utc).isoformat(),
+                            "content": submission.selftext.strip(),
+                            "votes": str(submission.score),
+                            "comments_count": str(submission.num_comments)
+                        }
+                        self._record_post(lang, post_data)
+                        logger.info(f"Successfully extracted post data: {post_data['title']}")
+                except Exception as e:
+                    logger.error(f"Error processing subreddit {subreddit}: {e}")
+    
+    def _scrape_html(self):
+        """Scrape all configured subreddits with a pool of Selenium browsers."""
+        tasks = [
+            (lang, f"https://old.reddit.com/r/{subreddit}/hot/")
+            for lang in self.all_posts
+            for subreddit in PROGRAMMING_LANGUAGES[lang]['subreddits']
+        ]
+        
+        if not tasks:
+            return
+        
+        # One worker (and WebDriver) per task, up to the configured limit
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+            list(executor.map(self._scrape_one, tasks))
+    
+    def _scrape_one(self, task):
+        """Scrape a single (language, subreddit URL) task on the calling thread's driver."""
+        lang, subreddit_url = task
+        
+        # Skip the subreddit if other workers already filled this language
+        if self.post_count[lang] >= self.max_posts:
+            logger.info(f"Reached maximum post count ({self.max_posts}) for {PROGRAMMING_LANGUAGES[lang]['name']}. Skipping {subreddit_url}")
+            return
+        
+        logger.info(f"Processing subreddit: {subreddit_url}")
+        try:
+            self.scrape_subreddit(subreddit_url, lang)
+        except Exception as e:
+            logger.error(f"Error processing subreddit {subreddit_url}: {e}")
+    
+    def _url_key(self, url):
+        """Return the key a URL is stored under in visited_urls."""
+        # Post IDs are base36, so post URLs collapse to a small int
+        post_id = _match_post_id(url)
+        return int(post_id, 36) if post_id else url
+    
+    def _mark_visited(self, url):
+        """Record a URL as visited. Returns False if it had already been visited."""
+        key = self._url_key(url)
+        with self._lock:
+            if key in self.visited_urls:
+                return False
+            self.visited_urls.add(key)
+            return True
+    
+    def _record_post(self, language, post_data):
+        """Add a scraped post to the results. Returns False if the language is already full."""
+        with self._lock:
+            if self.post_count[language] >= self.max_posts:
+                return False
+            
+            self.all_posts[language].append(post_data)
+            self.post_count[language] += 1
+            
+            # Checkpoint each post as one JSON line
+            fp = self._batch_fp[language]
+            fp.write(_json_line(post_data))
+            fp.flush()
+            return True
     
     def scrape_subreddit(self, start_url, language):
         """
@@ -232,64 +905,27 @@ class RedditSentimentAnalyzer:
         current_url = start_url
         page_num = 1
         
+        # One timestamp for every post in this subreddit pass
+        scraped_at = datetime.now(timezone.utc).isoformat()
+        
         while current_url and page_num <= self.max_pages and self.post_count[language] < self.max_posts:
-            if current_url in self.visited_urls:
+            if not self._mark_visited(current_url):
                 logger.info(f"Already visited: {current_url}, skipping...")
                 break
             
             logger.info(f"Page {page_num}/{self.max_pages}: {current_url}")
-            self.visited_urls.add(current_url)
             
             try:
                 # Navigate to the page
+                self.bucket.acquire()
                 self.driver.get(current_url)
                 
-                # Wait for content to load - try multiple selectors
+                # Wait for content to load - any of the post selectors
                 logger.info("Waiting for posts to load...")
-                post_found = False
-                
-                # Try multiple post selectors
-                post_selectors = [
-                    "div[data-testid='post-container']",
-                    "div.thing",
-                    "div.Post",
-                    "shreddit-post",
-                    "[data-click-id='body']"
-                ]
-                
-                for selector in post_selectors:
-                    try:
-                        WebDriverWait(self.driver, 15).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                        )
-                        logger.info(f"Found posts with selector: {selector}")
-                        post_found = True
-                        break
-                    except TimeoutException:
-                        continue
-                
-                if not post_found:
-                    logger.warning("No posts found on this page. Trying JavaScript detection...")
-                    
-                    # Try JavaScript to detect posts
-                    try:
-                        has_posts = self.driver.execute_script("""
-                            return Boolean(
-                                document.querySelector('div[data-testid="post-container"]') || 
-                                document.querySelector('div.thing') ||
-                                document.querySelector('div.Post') ||
-                                document.querySelector('shreddit-post') ||
-                                document.querySelector('[data-click-id="body"]')
-                            );
-                        """)
-                        
-                        if has_posts:
-                            logger.info("Found posts using JavaScript detection")
-                            post_found = True
-                        else:
-                            logger.warning("No posts detected even with JavaScript")
-                    except Exception as js_error:
-                        logger.error(f"JavaScript detection error: {js_error}")
+                selector = self._wait_for_any_selector(POST_SELECTORS)
+                post_found = selector is not None
+                if post_found:
+                    logger.info(f"Found posts with selector: {selector}")
                 
                 if not post_found:
                     # Last resort - look for any content that might be posts
@@ -306,31 +942,12 @@ class RedditSentimentAnalyzer:
                     logger.warning("No posts found on this page. Skipping to next URL...")
                     break
                 
-                # Scroll to load more content
-                logger.info("Scrolling to load more content...")
-                for i in range(3):
-                    self.driver.execute_script("window.scrollBy(0, window.innerHeight);")
-                    time.sleep(1)
-                
-                # Find all post links - try different methods
+                # Find all post links - old Reddit renders the whole page
+                # server-side, so no scrolling is needed
                 post_links = self._extract_post_links()
                 
                 if not post_links:
-                    logger.warning("No post links found, trying alternate methods...")
-                    time.sleep(2)  # Wait a bit more
-                    
-                    # Try once more with different scrolling
-                    self.driver.execute_script("window.scrollTo(0, 0);")  # Back to top
-                    time.sleep(1)
-                    for i in range(5):  # More scrolling
-                        self.driver.execute_script(f"window.scrollBy(0, {300 * (i+1)});")
-                        time.sleep(0.7)
-                    
-                    # Try again
-                    post_links = self._extract_post_links()
-                
-                if not post_links:
-                    logger.warning("Still couldn't find post links. Moving to next URL.")
+                    logger.warning("No post links found. Moving to next URL.")
                     break
                 
                 logger.info(f"Found {len(post_links)} post links")
@@ -341,25 +958,16 @@ class RedditSentimentAnalyzer:
                         logger.info(f"Reached maximum post count ({self.max_posts}) for {language}. Stopping.")
                         break
                     
-                    if post_url in self.visited_urls:
+                    if not self._mark_visited(post_url):
                         logger.info(f"Already visited post: {post_url}, skipping...")
                         continue
                     
                     logger.info(f"Processing post {index+1}/{len(post_links)}: {post_url}")
                     
                     try:
-                        post_data = self._extract_post_content(post_url, language)
+                        post_data = self._extract_post_content(post_url, language, scraped_at)
                         if post_data:
-                            self.all_posts[language].append(post_data)
-                            self.post_count[language] += 1
-                            
-                            # Save batch every 5 posts
-                            if self.post_count[language] % 5 == 0:
-                                batch_file = self.output_dir / f"{language}_posts_batch_{self.post_count[language]}.json"
-                                self._save_to_json(self.all_posts[language], batch_file)
-                        
-                        # Respect rate limits between posts
-                        time.sleep(self.request_delay)
+                            self._record_post(language, post_data)
                     
                     except Exception as e:
                         logger.error(f"Error processing post {post_url}: {e}")
@@ -378,24 +986,25 @@ class RedditSentimentAnalyzer:
                 logger.error(f"Error processing page {page_num}: {e}")
                 break
     
+    def _wait_for_any_selector(self, selectors, timeout=SELECTOR_WAIT_TIMEOUT):
+        """Wait until any of the selectors matches. Returns the matching selector, or None."""
+        try:
+            return self.driver.execute_async_script(WAIT_FOR_ANY_SELECTOR_JS, list(selectors), timeout * 1000)
+        except WebDriverException as e:
+            logger.warning(f"Error waiting for selectors: {e}")
+            return None
+    
     def _extract_post_links(self):
         """Extract post links using multiple methods."""
         post_links = []
         
         # Method 1: Standard link selectors
-        link_selectors = [
-            "a[data-click-id='body']",
-            "a.title",
-            "a[data-testid='post-title']",
-            "shreddit-post a[slot='full-post-link']",
-            "div.thing a.title"
-        ]
-        
-        for selector in link_selectors:
+        for selector in POST_LINK_SELECTORS:
             try:
                 links = self.driver.find_elements(By.CSS_SELECTOR, selector)
                 if links:
-                    found_links = [link.get_attribute('href') for link in links if link.get_attribute('href')]
+                    hrefs = (link.get_attribute('href') for link in links)
+                    found_links = [href for href in hrefs if href]
                     valid_links = [link for link in found_links if self._is_valid_post_link(link)]
                     if valid_links:
                         logger.info(f"Found {len(valid_links)} post links with selector: {selector}")
@@ -450,97 +1059,71 @@ class RedditSentimentAnalyzer:
         if not url:
             return False
         
-        # Valid post URLs typically contain '/comments/' 
-        return '/comments/' in url and 'reddit.com/r/' in url
+        return _match_post_id(url) is not None
     
     def _extract_post_id(self, url):
         """Extract a unique post ID from a Reddit post URL."""
         # URLs are typically like: https://www.reddit.com/r/subreddit/comments/post_id/post_title/
-        if '/comments/' in url:
-            parts = url.split('/comments/')
-            if len(parts) > 1:
-                post_id = parts[1].split('/')[0]
-                return post_id
+        post_id = _match_post_id(url)
+        if post_id:
+            return post_id
         
         # Fallback to hash
         return str(hash(url) % 10000)
     
-    def _extract_post_content(self, post_url, language):
-        """Extract the full content of a Reddit post."""
-        if post_url in self.visited_urls:
-            logger.info(f"Already visited: {post_url}, skipping...")
-            return None
-        
-        self.visited_urls.add(post_url)
+    def _extract_post_content(self, post_url, language, scraped_at):
+        """Extract the full content of a Reddit post. The caller marks the URL as visited."""
+        post_id = self._extract_post_id(post_url)
+        cached = self._get_cached_post(post_id)
+        if cached:
+            logger.info(f"Using cached post: {post_url}")
+            cached["language"] = language
+            return cached
         
         try:
             # Navigate to the post page
+            self.bucket.acquire()
             self.driver.get(post_url)
             
             # Wait for the post content to load - try multiple selectors with longer timeout
             logger.info("Waiting for post content to load...")
-            content_selectors = [
-                "div[data-testid='post-content']", 
-                "div[slot='text-body']",
-                "[data-click-id='text']",
-                "div.md",
-                ".sitetable .usertext-body",
-                "div[data-test-id='post-content']"
-            ]
-            
-            found_content = False
-            for selector in content_selectors:
-                try:
-                    WebDriverWait(self.driver, 15).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"Found post content with selector: {selector}")
-                    found_content = True
-                    break
-                except TimeoutException:
-                    continue
-            
-            # If content wasn't found, still try to extract what we can
-            if not found_content:
+            selector = self._wait_for_any_selector(POST_BODY_SELECTORS)
+            if selector:
+                logger.info(f"Found post content with selector: {selector}")
+            else:
+                # If content wasn't found, still try to extract what we can
                 logger.warning("Post content elements not found with standard selectors. Attempting extraction anyway.")
             
             # Initialize post data
-            post_id = self._extract_post_id(post_url)
             post_data = {
                 "post_id": post_id,
                 "post_url": post_url,
                 "language": language,
-                "scraped_at": datetime.now().isoformat()
+                "scraped_at": scraped_at
             }
             
-            # Extract post title
-            post_data["title"] = self._extract_post_title(post_url, post_id)
-            
-            # Extract author
-            post_data["author"] = self._extract_post_author()
-            
-            # Extract subreddit
-            post_data["subreddit"] = self._extract_post_subreddit(post_url)
-            
-            # Extract post date
-            post_data["post_date"] = self._extract_post_date()
-            
-            # Extract post content
-            post_data["content"] = self._extract_post_text_content()
-            
-            # Extract metadata (votes, comments)
-            self._extract_post_metadata(post_data)
-            
-            # Analyze sentiment
-            if post_data.get("content"):
-                post_data["sentiment"] = self.analyze_sentiment(post_data["content"])
-            elif post_data.get("title"):
-                post_data["sentiment"] = self.analyze_sentiment(post_data["title"])
+            # Extract all fields in one script
+            fields = self._extract_all_fields_js()
+            if any(fields.values()):
+                post_data.update({key: value for key, value in fields.items() if value})
+                
+                # Fill in missing fields without further WebDriver calls
+                post_data.setdefault("title", self._title_from_url(post_url, post_id))
+                post_data.setdefault("author", "Unknown")
+                post_data.setdefault("subreddit", self._subreddit_from_url(post_url))
+                post_data.setdefault("post_date", "Unknown Date")
+                post_data.setdefault("content", "")
             else:
-                post_data["sentiment"] = {'compound': 0, 'pos': 0, 'neu': 0, 'neg': 0}
+                # The script found nothing at all, so try the individual helpers
+                post_data["title"] = self._extract_post_title(post_url, post_id)
+                post_data["author"] = self._extract_post_author()
+                post_data["subreddit"] = self._extract_post_subreddit(post_url)
+                post_data["post_date"] = self._extract_post_date()
+                post_data["content"] = self._extract_post_text_content()
+                self._extract_post_metadata(post_data)
             
+            self._cache_post(post_data)
             logger.info(f"Successfully extracted post data: {post_data.get('title', 'Untitled')}")
-            logger.info(f"Sentiment: {post_data['sentiment']['compound']:.2f} (pos: {post_data['sentiment']['pos']:.2f}, neg: {post_data['sentiment']['neg']:.2f})")
             
             return post_data
             
@@ -548,12 +1131,19 @@ class RedditSentimentAnalyzer:
             logger.error(f"Error extracting post content for {post_url}: {e}", exc_info=True)
             return None
     
+    def _extract_all_fields_js(self):
+        """Extract title, author, subreddit, date, content, votes and comments count in one script."""
+        try:
+            return self.driver.execute_script(EXTRACT_POST_FIELDS_JS) or {}
+        except Exception as e:
+            logger.warning(f"Batched field extraction failed: {e}")
+            return {}
+    
     def _extract_post_title(self, post_url, post_id):
         """Extract the post title using multiple methods."""
         try:
             # Method 1: Standard selectors
-            title_selectors = ["h1", "h1[slot='title']", ".title a", "[data-testid='post-title']"]
-            for selector in title_selectors:
+            for selector in TITLE_SELECTORS:
                 try:
                     title_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     title = title_element.text.strip()
@@ -564,27 +1154,7 @@ class RedditSentimentAnalyzer:
             
             # Method 2: JavaScript extraction
             try:
-                title = self.driver.execute_script("""
-                    // Try various title selectors
-                    const selectors = ['h1', 'h1[slot="title"]', '.title a', '[data-testid="post-title"]'];
-                    for (const selector of selectors) {
-                        const element = document.querySelector(selector);
-                        if (element && element.textContent.trim()) {
-                            return element.textContent.trim();
-                        }
-                    }
-                    
-                    // Try shadow DOM
-                    const postElement = document.querySelector('shreddit-post');
-                    if (postElement && postElement.shadowRoot) {
-                        const titleElem = postElement.shadowRoot.querySelector('h1, [slot="title"]');
-                        if (titleElem) {
-                            return titleElem.textContent.trim();
-                        }
-                    }
-                    
-                    return null;
-                """)
+                title = self.driver.execute_script(TITLE_JS)
                 
                 if title:
                     return title
@@ -592,28 +1162,35 @@ class RedditSentimentAnalyzer:
                 pass
             
             # Method 3: Extract from URL as last resort
-            url_parts = post_url.split('/')
-            if len(url_parts) > 1:
-                potential_title = url_parts[-2] if url_parts[-1] == '' else url_parts[-1]
-                return potential_title.replace('_', ' ').replace('-', ' ').title()
-                
-            # Final fallback
-            return f"Post {post_id}"
+            return self._title_from_url(post_url, post_id)
             
         except Exception as e:
             logger.error(f"Error extracting title: {e}")
             return f"Post {post_id}"
     
+    def _title_from_url(self, post_url, post_id):
+        """Derive a title from the slug at the end of a post URL."""
+        url_parts = post_url.split('/')
+        if len(url_parts) > 1:
+            potential_title = url_parts[-2] if url_parts[-1] == '' else url_parts[-1]
+            return potential_title.replace('_', ' ').replace('-', ' ').title()
+            
+        # Final fallback
+        return f"Post {post_id}"
+    
+    def _subreddit_from_url(self, post_url):
+        """Derive the subreddit name from a post URL."""
+        if "/r/" in post_url:
+            match = SUBREDDIT_RE.search(post_url)
+            if match:
+                return f"r/{match.group(1)}"
+        
+        return "Unknown Subreddit"
+    
     def _extract_post_author(self):
         """Extract the post author."""
         try:
-            author_selectors = [
-                "a[data-testid='post_author']", 
-                "a[slot='author']",
-                ".author",
-                "a.author"
-            ]
-            for selector in author_selectors:
+            for selector in AUTHOR_SELECTORS:
                 try:
                     author_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     author = author_element.text.strip()
@@ -624,26 +1201,7 @@ class RedditSentimentAnalyzer:
             
             # JavaScript extraction
             try:
-                author = self.driver.execute_script("""
-                    const selectors = ['a[data-testid="post_author"]', 'a[slot="author"]', '.author', 'a.author'];
-                    for (const selector of selectors) {
-                        const element = document.querySelector(selector);
-                        if (element && element.textContent.trim()) {
-                            return element.textContent.trim();
-                        }
-                    }
-                    
-                    // Try shadow DOM
-                    const postElement = document.querySelector('shreddit-post');
-                    if (postElement && postElement.shadowRoot) {
-                        const authorElem = postElement.shadowRoot.querySelector('a[slot="author"]');
-                        if (authorElem) {
-                            return authorElem.textContent.trim();
-                        }
-                    }
-                    
-                    return null;
-                """)
+                author = self.driver.execute_script(AUTHOR_JS)
                 
                 if author:
                     return author
@@ -659,13 +1217,7 @@ class RedditSentimentAnalyzer:
         """Extract the subreddit from the post."""
         try:
             # Method 1: From selectors
-            subreddit_selectors = [
-                "a[data-testid='subreddit-link']", 
-                "a[slot='subreddit-name']",
-                ".subreddit",
-                "a.subreddit"
-            ]
-            for selector in subreddit_selectors:
+            for selector in SUBREDDIT_SELECTORS:
                 try:
                     subreddit_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     subreddit = subreddit_element.text.strip()
@@ -675,12 +1227,7 @@ class RedditSentimentAnalyzer:
                     continue
             
             # Method 2: From URL
-            if "/r/" in post_url:
-                match = re.search(r"/r/([^/]+)", post_url)
-                if match:
-                    return f"r/{match.group(1)}"
-            
-            return "Unknown Subreddit"
+            return self._subreddit_from_url(post_url)
         except Exception as e:
             logger.error(f"Error extracting subreddit: {e}")
             return "Unknown Subreddit"
@@ -688,13 +1235,7 @@ class RedditSentimentAnalyzer:
     def _extract_post_date(self):
         """Extract the post date."""
         try:
-            date_selectors = [
-                "span[data-testid='post_timestamp']", 
-                "span[slot='posted-time']",
-                "time",
-                ".tagline time"
-            ]
-            for selector in date_selectors:
+            for selector in DATE_SELECTORS:
                 try:
                     date_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     date = date_element.text.strip()
@@ -705,26 +1246,7 @@ class RedditSentimentAnalyzer:
             
             # JavaScript extraction
             try:
-                date = self.driver.execute_script("""
-                    const selectors = ['span[data-testid="post_timestamp"]', 'span[slot="posted-time"]', 'time', '.tagline time'];
-                    for (const selector of selectors) {
-                        const element = document.querySelector(selector);
-                        if (element && element.textContent.trim()) {
-                            return element.textContent.trim();
-                        }
-                    }
-                    
-                    // Try shadow DOM
-                    const postElement = document.querySelector('shreddit-post');
-                    if (postElement && postElement.shadowRoot) {
-                        const timeElem = postElement.shadowRoot.querySelector('span[slot="posted-time"]');
-                        if (timeElem) {
-                            return timeElem.textContent.trim();
-                        }
-                    }
-                    
-                    return null;
-                """)
+                date = self.driver.execute_script(DATE_JS)
                 
                 if date:
                     return date
@@ -740,15 +1262,7 @@ class RedditSentimentAnalyzer:
         """Extract the post text content."""
         try:
             # Method 1: Standard selectors
-            content_selectors = [
-                "div[data-test-id='post-content']", 
-                "div[slot='text-body']", 
-                "[data-click-id='text']",
-                "div.md",
-                ".sitetable .usertext-body"
-            ]
-            
-            for content_selector in content_selectors:
+            for content_selector in CONTENT_SELECTORS:
                 try:
                     content_element = self.driver.find_element(By.CSS_SELECTOR, content_selector)
                     content = content_element.text.strip()
@@ -759,49 +1273,17 @@ class RedditSentimentAnalyzer:
             
             # Method 2: JavaScript extraction
             try:
-                content = self.driver.execute_script("""
-                    // Try various content selectors
-                    const selectors = ['div[data-test-id="post-content"]', 'div[slot="text-body"]', '[data-click-id="text"]', 'div.md', '.sitetable .usertext-body'];
-                    for (const selector of selectors) {
-                        const element = document.querySelector(selector);
-                        if (element && element.textContent.trim()) {
-                            return element.textContent.trim();
-                        }
-                    }
-                    
-                    // Try shadow DOM
-                    const postElement = document.querySelector('shreddit-post');
-                    if (postElement && postElement.shadowRoot) {
-                        const contentElem = postElement.shadowRoot.querySelector('div[slot="text-body"], [data-click-id="text"]');
-                        if (contentElem) {
-                            return contentElem.textContent.trim();
-                        }
-                    }
-                    
-                    return null;
-                """)
+                content = self.driver.execute_script(CONTENT_JS)
                 
                 if content:
                     return content
             except Exception as e:
                 logger.error(f"JavaScript content extraction failed: {e}")
             
-            # Method 3: Paragraph extraction
+            # Method 3: Paragraph extraction, skipping short paragraphs and
+            # those in navigation, header, footer and other UI areas
             try:
-                paragraphs = self.driver.find_elements(By.TAG_NAME, "p")
-                # Filter out navigation, header, and footer paragraphs
-                content_paragraphs = []
-                for p in paragraphs:
-                    # Skip small paragraphs that are likely UI elements
-                    if len(p.text.strip()) < 20:
-                        continue
-                        
-                    # Skip paragraphs in common UI areas
-                    if self._is_in_ui_area(p):
-                        continue
-                        
-                    content_paragraphs.append(p.text.strip())
-                
+                content_paragraphs = self.driver.execute_script(EXTRACT_PARAGRAPHS_JS, UI_INDICATOR_PATTERN)
                 if content_paragraphs:
                     return "\n\n".join(content_paragraphs)
             except Exception as e:
@@ -817,8 +1299,7 @@ class RedditSentimentAnalyzer:
         """Extract additional metadata like votes and comments count."""
         try:
             # Extract votes
-            vote_selectors = ["div[id^='vote-arrows-']", "faceplate-number[slot='upvote-count']", ".score.unvoted", ".score"]
-            for selector in vote_selectors:
+            for selector in VOTE_SELECTORS:
                 try:
                     votes_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     post_data["votes"] = votes_element.text.strip()
@@ -829,26 +1310,7 @@ class RedditSentimentAnalyzer:
             # JavaScript extraction for votes if needed
             if "votes" not in post_data:
                 try:
-                    votes = self.driver.execute_script("""
-                        const selectors = ["div[id^='vote-arrows-']", "faceplate-number[slot='upvote-count']", ".score.unvoted", ".score"];
-                        for (const selector of selectors) {
-                            const element = document.querySelector(selector);
-                            if (element && element.textContent.trim()) {
-                                return element.textContent.trim();
-                            }
-                        }
-                        
-                        // Try shadow DOM
-                        const postElement = document.querySelector('shreddit-post');
-                        if (postElement && postElement.shadowRoot) {
-                            const votesElem = postElement.shadowRoot.querySelector("faceplate-number[slot='upvote-count']");
-                            if (votesElem) {
-                                return votesElem.textContent.trim();
-                            }
-                        }
-                        
-                        return null;
-                    """)
+                    votes = self.driver.execute_script(VOTES_JS)
                     
                     if votes:
                         post_data["votes"] = votes
@@ -856,8 +1318,7 @@ class RedditSentimentAnalyzer:
                     pass
             
             # Extract comments count
-            comment_selectors = ["span[data-click-id='comments']", "span[slot='comment-count']", ".comments", "a.comments"]
-            for selector in comment_selectors:
+            for selector in COMMENT_SELECTORS:
                 try:
                     comments_element = self.driver.find_element(By.CSS_SELECTOR, selector)
                     post_data["comments_count"] = comments_element.text.strip()
@@ -868,26 +1329,7 @@ class RedditSentimentAnalyzer:
             # JavaScript extraction for comments if needed
             if "comments_count" not in post_data:
                 try:
-                    comments = self.driver.execute_script("""
-                        const selectors = ["span[data-click-id='comments']", "span[slot='comment-count']", ".comments", "a.comments"];
-                        for (const selector of selectors) {
-                            const element = document.querySelector(selector);
-                            if (element && element.textContent.trim()) {
-                                return element.textContent.trim();
-                            }
-                        }
-                        
-                        // Try shadow DOM
-                        const postElement = document.querySelector('shreddit-post');
-                        if (postElement && postElement.shadowRoot) {
-                            const commentsElem = postElement.shadowRoot.querySelector("span[slot='comment-count']");
-                            if (commentsElem) {
-                                return commentsElem.textContent.trim();
-                            }
-                        }
-                        
-                        return null;
-                    """)
+                    comments = self.driver.execute_script(COMMENTS_JS)
                     
                     if comments:
                         post_data["comments_count"] = comments
@@ -896,66 +1338,35 @@ class RedditSentimentAnalyzer:
         except Exception as e:
             logger.error(f"Error extracting metadata: {e}")
     
-    def _is_in_ui_area(self, element):
-        """Check if an element is part of the UI rather than content."""
-        try:
-            # Check parent elements
-            parent = element
-            for _ in range(5):  # Check up to 5 levels up
-                if not parent:
-                    break
-                    
-                parent_class = parent.get_attribute("class") or ""
-                parent_id = parent.get_attribute("id") or ""
-                
-                # Common UI area classes and IDs
-                ui_indicators = [
-                    "header", "footer", "sidebar", "navigation", "nav", "menu", 
-                    "comment", "toolbar", "banner", "ad", "widget", "modal", 
-                    "popup", "overlay", "tooltip", "community-widget"
-                ]
-                
-                for indicator in ui_indicators:
-                    if indicator in parent_class.lower() or indicator in parent_id.lower():
-                        return True
-                
-                # Get parent
-                parent = parent.find_element(By.XPATH, "..")
-        except:
-            pass
-            
-        return False
-        
+    def _count_posts(self):
+        """Count the posts currently rendered on a listing page."""
+        return len(self.driver.find_elements(By.CSS_SELECTOR, POST_CONTAINER_SELECTOR))
+    
     def _find_next_page_or_load_more(self):
         """Find the next page button or load more content button."""
         try:
             # Method 1: Look for standard next page buttons
-            next_button_selectors = [
-                "button[aria-label='Next']",
-                "a.next-button",
-                "span.next-button a",
-                "a[rel='next']",
-                ".nav-buttons .next-button a",
-                "a.next"
-            ]
-            
-            for selector in next_button_selectors:
+            for selector in NEXT_BUTTON_SELECTORS:
                 try:
                     next_button = self.driver.find_element(By.CSS_SELECTOR, selector)
+                    attrs = self.driver.execute_script(BUTTON_ATTRS_JS, next_button)
                     
                     # Skip if disabled
-                    if next_button.get_attribute("disabled") == "true":
+                    if attrs["disabled"]:
                         continue
                     
                     logger.info(f"Found next button with selector: {selector}")
                     
                     # If it's a link, get the href
-                    if next_button.tag_name.lower() == "a":
-                        return next_button.get_attribute("href")
+                    if attrs["tag"] == "a":
+                        return attrs["href"]
                     
-                    # If it's a button, click it and get the new URL
+                    # If it's a button, click it and wait for the page to be replaced
                     next_button.click()
-                    time.sleep(2)  # Wait for navigation
+                    try:
+                        WebDriverWait(self.driver, PAGE_CHANGE_TIMEOUT).until(EC.staleness_of(next_button))
+                    except TimeoutException:
+                        logger.warning("Page didn't change after clicking next button")
                     return self.driver.current_url
                 except NoSuchElementException:
                     continue
@@ -963,15 +1374,7 @@ class RedditSentimentAnalyzer:
                     logger.warning(f"Error with next button: {e}")
             
             # Method 2: Look for "Load more" buttons
-            load_more_selectors = [
-                "button:contains('Load more')",
-                "button.MoreCommentsLink",
-                "a:contains('load more')",
-                "button[data-click-id='load-more']",
-                "button.button:contains('More')"
-            ]
-            
-            for selector in load_more_selectors:
+            for selector in LOAD_MORE_SELECTORS:
                 try:
                     # For :contains() pseudo-selector, need to use JavaScript
                     if ":contains" in selector:
@@ -986,18 +1389,31 @@ class RedditSentimentAnalyzer:
                         
                     if load_more:
                         logger.info(f"Found load more button")
+                        old_content = self._count_posts()
                         load_more.click()
-                        time.sleep(3)  # Wait for content to load
+                        try:
+                            WebDriverWait(self.driver, PAGE_CHANGE_TIMEOUT).until(
+                                lambda driver: self._count_posts() > old_content
+                            )
+                        except TimeoutException:
+                            logger.warning("No new content after clicking load more")
                         return self.driver.current_url
                 except Exception:
                     continue
             
             # Method 3: Check for infinite scroll - scroll down and see if URL changes or new content loads
             try:
-                old_content = len(self.driver.find_elements(By.CSS_SELECTOR, "div[data-testid='post-container'], shreddit-post, div.thing"))
+                old_content = self._count_posts()
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)  # Wait for possible content to load
-                new_content = len(self.driver.find_elements(By.CSS_SELECTOR, "div[data-testid='post-container'], shreddit-post, div.thing"))
+                
+                # Wait for possible content to load
+                try:
+                    WebDriverWait(self.driver, SCROLL_LOAD_TIMEOUT).until(
+                        lambda driver: self._count_posts() > old_content
+                    )
+                except TimeoutException:
+                    pass
+                new_content = self._count_posts()
                 
                 if new_content > old_content:
                     logger.info(f"Detected infinite scroll - new content loaded ({old_content} -> {new_content})")
@@ -1007,12 +1423,11 @@ class RedditSentimentAnalyzer:
             
             # Method 4: Check URL for page number and increment
             current_url = self.driver.current_url
-            page_match = re.search(r'page=(\d+)', current_url)
+            page_match = PAGE_RE.search(current_url)
             if page_match:
-                current_page = int(page_match.group(1))
-                next_page = current_page + 1
-                next_url = re.sub(r'page=\d+', f'page={next_page}', current_url)
-                return next_url
+                next_page = int(page_match.group(1)) + 1
+                start, end = page_match.span()
+                return f"{current_url[:start]}page={next_page}{current_url[end:]}"
             elif '?' in current_url:
                 return f"{current_url}&page=2"
             else:
@@ -1022,12 +1437,20 @@ class RedditSentimentAnalyzer:
             logger.error(f"Error finding next page: {e}")
             return None
     
-    def _save_to_json(self, data, filepath):
-        """Save data to a JSON file."""
+    def _save_to_json(self, data, filepath, compact=False):
+        """Save data to a JSON file, indented unless compact is set."""
         try:
-            filepath.parent.mkdir(exist_ok=True, parents=True)
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+                if not compact:
+                    option |= orjson.OPT_INDENT_2
+                filepath.write_bytes(orjson.dumps(data, option=option))
+            else:
+                with open(filepath, "w", encoding="utf-8") as f:
+                    if compact:
+                        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+                    else:
+                        json.dump(data, f, ensure_ascii=False, indent=2)
             logger.info(f"Data saved to {filepath}")
         except Exception as e:
             logger.error(f"Error saving to JSON: {e}")
@@ -1037,66 +1460,99 @@ class RedditSentimentAnalyzer:
         try:
             logger.info("Analyzing sentiment data for all languages...")
             
-            # Prepare DataFrame for sentiment analysis
-            sentiment_data = []
+            # Sentiment is scored here, after scraping, rather than per post
+            self._score_all()
+            
+            # Save language results
+            for lang in self.all_posts:
+                lang_output_path = self.output_dir / f"{lang}_posts.json"
+                self._save_to_json(self.all_posts[lang], lang_output_path)
+                logger.info(f"Completed analysis for {PROGRAMMING_LANGUAGES[lang]['name']}. Total posts scraped: {len(self.all_posts[lang])}")
+            
+            # Gather the sentiment CSV columns and each language's score array in one pass
+            columns = {
+                'language': [], 'post_id': [], 'title': [], 'subreddit': [],
+                'compound': [], 'positive': [], 'neutral': [], 'negative': []
+            }
+            sentiment_arrays = {}
             
             for lang in self.languages:
-                if lang not in self.all_posts or not self.all_posts[lang]:
+                scored = [post for post in self.all_posts.get(lang, []) if 'sentiment' in post]
+                if not scored:
                     continue
                 
-                for post in self.all_posts[lang]:
-                    if 'sentiment' in post:
-                        # Extract language info
-                        lang_name = PROGRAMMING_LANGUAGES.get(lang, {}).get('name', lang)
-                        
-                        # Add entry
-                        sentiment_data.append({
-                            'language': lang_name,
-                            'post_id': post.get('post_id', ''),
-                            'title': post.get('title', ''),
-                            'subreddit': post.get('subreddit', ''),
-                            'compound': post['sentiment'].get('compound', 0),
-                            'positive': post['sentiment'].get('pos', 0),
-                            'neutral': post['sentiment'].get('neu', 0),
-                            'negative': post['sentiment'].get('neg', 0),
-                        })
+                lang_name = self.language_names[lang]
+                first_row = len(columns['language'])
+                columns['language'].extend([lang_name] * len(scored))
+                
+                for post in scored:
+                    sentiment = post['sentiment']
+                    columns['post_id'].append(post.get('post_id', ''))
+                    columns['title'].append(post.get('title', ''))
+                    columns['subreddit'].append(post.get('subreddit', ''))
+                    # Stored as floats so neutral (integer zero) scores are written as 0.0
+                    columns['compound'].append(float(sentiment.get('compound', 0)))
+                    columns['positive'].append(float(sentiment.get('pos', 0)))
+                    columns['neutral'].append(float(sentiment.get('neu', 0)))
+                    columns['negative'].append(float(sentiment.get('neg', 0)))
+                
+                # Pack this language's scores into a structured array for aggregation
+                arr = np.empty(len(scored), dtype=SENTIMENT_DTYPE)
+                for field in arr.dtype.names:
+                    arr[field] = columns[field][first_row:]
+                sentiment_arrays[lang_name] = arr
             
-            if not sentiment_data:
+            if not sentiment_arrays:
                 logger.warning("No sentiment data available for analysis!")
                 return
             
-            # Convert to DataFrame
-            df = pd.DataFrame(sentiment_data)
-            
             # Save full sentiment data
             sentiment_csv_path = self.output_dir / "sentiment_analysis.csv"
-            df.to_csv(sentiment_csv_path, index=False)
+            with open(sentiment_csv_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(columns)
+                writer.writerows(zip(*columns.values()))
             logger.info(f"Sentiment data saved to {sentiment_csv_path}")
             
             # Create JSON outputs
-            self._create_json_outputs(df)
+            self._create_json_outputs(sentiment_arrays)
             
         except Exception as e:
             logger.error(f"Error analyzing results: {e}", exc_info=True)
     
-    def _create_json_outputs(self, df):
-        """Create JSON output of sentiment analysis results."""
+    def _create_json_outputs(self, sentiment_arrays):
+        """Create JSON output of sentiment analysis results from per-language score arrays."""
         try:
             logger.info("Creating JSON outputs...")
             
-            # Calculate average sentiment by language
-            avg_sentiment = df.groupby('language')['compound'].mean().to_dict()
-            
-            # Calculate positive and negative components
-            pos_components = df.groupby('language')['positive'].mean().to_dict()
-            neg_components = df.groupby('language')['negative'].mean().to_dict()
+            # Calculate each language's statistics once, for both the summary and the per-language files
+            language_stats = {}
+            for language, arr in sentiment_arrays.items():
+                compound = arr['compound']
+                distribution = dict(zip(SENTIMENT_BUCKETS, _sentiment_distribution(compound).tolist()))
+                
+                # Calculate statistics
+                stats = {
+                    'language': language,
+                    'average_sentiment': float(compound.mean()),
+                    'median_sentiment': float(np.median(compound)),
+                    # Sample standard deviation, undefined (null) for a single post
+                    'std_deviation': float(compound.std(ddof=1)) if len(compound) > 1 else None,
+                    'positive_component': float(arr['positive'].mean()),
+                    'negative_component': float(arr['negative'].mean()),
+                    'neutral_component': float(arr['neutral'].mean()),
+                    'post_count': len(arr),
+                    'sentiment_distribution': {bucket: distribution[bucket] for bucket in reversed(SENTIMENT_BUCKETS)}
+                }
+                language_stats[language] = stats
             
-            # Prepare summary data
+            # Prepare summary data, keyed by language name in sorted order
+            summary_languages = sorted(language_stats)
             summary_data = {
-                'average_sentiment': avg_sentiment,
-                'positive_components': pos_components,
-                'negative_components': neg_components,
-                'post_counts': df.groupby('language').size().to_dict(),
+                'average_sentiment': {language: language_stats[language]['average_sentiment'] for language in summary_languages},
+                'positive_components': {language: language_stats[language]['positive_component'] for language in summary_languages},
+                'negative_components': {language: language_stats[language]['negative_component'] for language in summary_languages},
+                'post_counts': {language: language_stats[language]['post_count'] for language in summary_languages},
                 'generated_at': datetime.now().isoformat()
             }
             
@@ -1106,28 +1562,7 @@ class RedditSentimentAnalyzer:
             logger.info(f"Summary JSON saved to {summary_path}")
             
             # Create detailed language JSON files
-            for language in df['language'].unique():
-                language_df = df[df['language'] == language]
-                
-                # Calculate statistics
-                stats = {
-                    'language': language,
-                    'average_sentiment': language_df['compound'].mean(),
-                    'median_sentiment': language_df['compound'].median(),
-                    'std_deviation': language_df['compound'].std(),
-                    'positive_component': language_df['positive'].mean(),
-                    'negative_component': language_df['negative'].mean(),
-                    'neutral_component': language_df['neutral'].mean(),
-                    'post_count': len(language_df),
-                    'sentiment_distribution': {
-                        'very_positive': len(language_df[language_df['compound'] > 0.5]),
-                        'positive': len(language_df[(language_df['compound'] <= 0.5) & (language_df['compound'] > 0.05)]),
-                        'neutral': len(language_df[(language_df['compound'] >= -0.05) & (language_df['compound'] <= 0.05)]),
-                        'negative': len(language_df[(language_df['compound'] >= -0.5) & (language_df['compound'] < -0.05)]),
-                        'very_negative': len(language_df[language_df['compound'] < -0.5])
-                    }
-                }
-                
+            for language, stats in language_stats.items():
                 # Save language stats
                 lang_key = language.lower()
                 lang_stats_path = self.output_dir / f"{lang_key}_sentiment_stats.json"
@@ -1140,7 +1575,7 @@ class RedditSentimentAnalyzer:
                 if lang not in self.all_posts or not self.all_posts[lang]:
                     continue
                     
-                lang_name = PROGRAMMING_LANGUAGES.get(lang, {}).get('name', lang)
+                lang_name = self.language_names[lang]
                 lang_data = {
                     'language': lang_name,
                     'posts': self.all_posts[lang]
@@ -1149,7 +1584,8 @@ class RedditSentimentAnalyzer:
                 complete_data.append(lang_data)
             
             complete_path = self.output_dir / "complete_sentiment_analysis.json"
-            self._save_to_json(complete_data, complete_path)
+            # Machine-consumed and by far the largest output, so written without indentation
+            self._save_to_json(complete_data, complete_path, compact=True)
             logger.info(f"Complete analysis saved to {complete_path}")
             
         except Exception as e:
@@ -1172,10 +1608,19 @@ def load_config_from_env():
         'MAX_POSTS': os.getenv('MAX_POSTS', '20'),
         
         # Rate limiting
-        'REQUEST_DELAY': os.getenv('REQUEST_DELAY', '3000'),
+        'REQUESTS_PER_MINUTE': os.getenv('REQUESTS_PER_MINUTE', '60'),
+        
+        # Hours before a cached post is scraped again
+        'CACHE_TTL': os.getenv('CACHE_TTL', '24'),
         
         # Output settings
         'OUTPUT_DIR': os.getenv('OUTPUT_DIR', 'output'),
+        
+        # Scraping backend
+        'SCRAPE_HTML': os.getenv('SCRAPE_HTML', 'false'),
+        'MAX_WORKERS': os.getenv('MAX_WORKERS', '8'),
+        'REDDIT_CLIENT_ID': os.getenv('REDDIT_CLIENT_ID', ''),
+        'REDDIT_CLIENT_SECRET': os.getenv('REDDIT_CLIENT_SECRET', ''),
     }
     
     # Convert comma-separated string to list
@@ -1193,6 +1638,8 @@ def main():
     parser.add_argument('--max-posts', type=int, help='Maximum total posts to scrape per language')
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
     parser.add_argument('--output-dir', type=str, help='Directory to save output files')
+    parser.add_argument('--scrape-html', action='store_true', help='Scrape with a Selenium browser instead of the Reddit JSON endpoints')
+    parser.add_argument('--workers', type=int, help='Maximum browsers to run in parallel with --scrape-html')
     args = parser.parse_args()
     
     # Load config from .env file
@@ -1214,6 +1661,12 @@ def main():
     if args.output_dir:
         config['OUTPUT_DIR'] = args.output_dir
     
+    if args.scrape_html:
+        config['SCRAPE_HTML'] = 'true'
+    
+    if args.workers:
+        config['MAX_WORKERS'] = str(args.workers)
+    
     # Initialize and run the analyzer
     analyzer = RedditSentimentAnalyzer(config)
     analyzer.start_analysis()